@@ -4,17 +4,43 @@
 # --------------------------------------------------------------------------------------------
 
 import argparse
+import re
+
+from knack.util import CLIError
 
 from azure.cli.command_modules.monitor.util import (
     get_aggregation_map, get_operator_map, get_autoscale_operator_map,
     get_autoscale_aggregation_map, get_autoscale_scale_direction_map)
 
+_PERIOD_RE = re.compile(r'(p)?(\d+y)?(\d+m)?(\d+d)?(t)?(\d+h)?(\d+m)?(\d+s)?')
+
+_MONITOR_MODELS = None
+_TIMEZONE_MAP = None
+
+_NOTIFICATION_TYPES = frozenset(('email', 'webhook'))
+
+
+def _get_monitor_models():
+    # the models module is costly to import, so load it on first use rather than with the command table
+    global _MONITOR_MODELS  # pylint: disable=global-statement
+    if _MONITOR_MODELS is None:
+        from azure.mgmt.monitor import models
+        _MONITOR_MODELS = models
+    return _MONITOR_MODELS
+
+
+def _get_timezone_map():
+    # maps lower-cased time zone names to their canonical form; built once on first use
+    global _TIMEZONE_MAP  # pylint: disable=global-statement
+    if _TIMEZONE_MAP is None:
+        from azure.cli.command_modules.monitor._autoscale_util import AUTOSCALE_TIMEZONES
+        _TIMEZONE_MAP = {x['name'].lower(): x['name'] for x in AUTOSCALE_TIMEZONES}
+    return _TIMEZONE_MAP
+
 
 def timezone_name_type(value):
-    from azure.cli.command_modules.monitor._autoscale_util import AUTOSCALE_TIMEZONES
-    zone = next((x['name'] for x in AUTOSCALE_TIMEZONES if x['name'].lower() == value.lower()), None)
+    zone = _get_timezone_map().get(value.lower())
     if not zone:
-        from knack.util import CLIError
         raise CLIError(
             "Invalid time zone: '{}'. Run 'az monitor autoscale profile list-timezones' for values.".format(value))
     return zone
@@ -23,25 +49,18 @@ def timezone_name_type(value):
 def timezone_offset_type(value):
 
     try:
-        hour, minute = str(value).split(':')
+        hour, minute = value.split(':')
     except ValueError:
-        hour = str(value)
+        hour = value
         minute = None
 
     hour = int(hour)
 
     if hour > 14 or hour < -12:
-        from knack.util import CLIError
         raise CLIError('Offset out of range: -12 to +14')
 
-    if hour >= 0 and hour < 10:
-        value = '+0{}'.format(hour)
-    elif hour >= 10:
-        value = '+{}'.format(hour)
-    elif hour < 0 and hour > -10:
-        value = '-0{}'.format(-1 * hour)
-    else:
-        value = str(hour)
+    # signed and zero-padded to two digits, e.g. +05, -07, +14
+    value = '{:+03d}'.format(hour)
     if minute:
         value = '{}:{}'.format(value, minute)
     return value
@@ -49,55 +68,65 @@ def timezone_offset_type(value):
 
 def period_type(value):
 
-    import re
-
-    def _get_substring(indices):
-        if indices == tuple([-1, -1]):
-            return ''
-        return value[indices[0]: indices[1]]
-
-    regex = r'(p)?(\d+y)?(\d+m)?(\d+d)?(t)?(\d+h)?(\d+m)?(\d+s)?'
-    match = re.match(regex, value.lower())
-    match_len = match.regs[0]
-    if match_len != tuple([0, len(value)]):
+    # every group is optional, so the pattern always matches from position 0; it is only
+    # valid if it consumed the whole string
+    match = _PERIOD_RE.match(value.lower())
+    if match.end() != len(value):
         raise ValueError
     # simply return value if a valid ISO8601 string is supplied
-    if match.regs[1] != tuple([-1, -1]) and match.regs[5] != tuple([-1, -1]):
+    if match.start(1) != -1 and match.start(5) != -1:
         return value
 
     # if shorthand is used, only support days, minutes, hours, seconds
     # ensure M is interpretted as minutes
-    days = _get_substring(match.regs[4])
-    minutes = _get_substring(match.regs[6]) or _get_substring(match.regs[3])
-    hours = _get_substring(match.regs[7])
-    seconds = _get_substring(match.regs[8])
-    return 'P{}T{}{}{}'.format(days, minutes, hours, seconds).upper()
+    days = match.group(4) or ''
+    minutes = match.group(6) or match.group(3) or ''
+    hours = match.group(7) or ''
+    seconds = match.group(8) or ''
+    return ('P%sT%s%s%s' % (days, minutes, hours, seconds)).upper()
 
 
 # pylint: disable=too-few-public-methods
 class ConditionAction(argparse.Action):
     def __call__(self, parser, namespace, values, option_string=None):
-        from azure.mgmt.monitor.models import ThresholdRuleCondition, RuleMetricDataSource
+        models = _get_monitor_models()
         # get default description if not specified
         if namespace.description is None:
             namespace.description = ' '.join(values)
         if len(values) == 1:
             # workaround because CMD.exe eats > character... Allows condition to be
-            # specified as a quoted expression
-            values = values[0].split(' ')
+            # specified as a quoted expression. Only the trailing four tokens are split off so a
+            # metric name containing spaces stays whole.
+            values = values[0].rsplit(' ', 4)
         if len(values) < 5:
-            from knack.util import CLIError
             raise CLIError('usage error: --condition METRIC {>,>=,<,<=} THRESHOLD {avg,min,max,total,last} DURATION')
         metric_name = ' '.join(values[:-4])
         operator = get_operator_map()[values[-4]]
         threshold = int(values[-3])
         aggregation = get_aggregation_map()[values[-2].lower()]
         window = period_type(values[-1])
-        metric = RuleMetricDataSource(None, metric_name)  # target URI will be filled in later
-        condition = ThresholdRuleCondition(operator, threshold, metric, window, aggregation)
+        metric = models.RuleMetricDataSource(None, metric_name)  # target URI will be filled in later
+        condition = models.ThresholdRuleCondition(operator, threshold, metric, window, aggregation)
         namespace.condition = condition
 
 
+def _parse_notification(values, option_string, email_cls, webhook_cls):
+    """ Build an email or webhook notification from TYPE KEY [ARGS] using the given model classes. """
+    _type = values[0].lower()
+    if _type == 'email':
+        return email_cls(custom_emails=values[1:])
+    elif _type == 'webhook':
+        properties = {}
+        for item in values[2:]:
+            key, sep, val = item.partition('=')
+            if not sep:
+                raise CLIError('usage error: {} webhook URI [KEY=VALUE ...]'.format(option_string))
+            properties[key] = val
+        return webhook_cls(values[1], properties)
+
+    raise CLIError('usage error: {} TYPE KEY [ARGS]'.format(option_string))
+
+
 # pylint: disable=protected-access
 class AlertAddAction(argparse._AppendAction):
     def __call__(self, parser, namespace, values, option_string=None):
@@ -105,21 +134,8 @@ class AlertAddAction(argparse._AppendAction):
         super(AlertAddAction, self).__call__(parser, namespace, action, option_string)
 
     def get_action(self, values, option_string):  # pylint: disable=no-self-use
-        from knack.util import CLIError
-        _type = values[0].lower()
-        if _type == 'email':
-            from azure.mgmt.monitor.models import RuleEmailAction
-            return RuleEmailAction(custom_emails=values[1:])
-        elif _type == 'webhook':
-            from azure.mgmt.monitor.models import RuleWebhookAction
-            uri = values[1]
-            try:
-                properties = dict(x.split('=', 1) for x in values[2:])
-            except ValueError:
-                raise CLIError('usage error: {} webhook URI [KEY=VALUE ...]'.format(option_string))
-            return RuleWebhookAction(uri, properties)
-
-        raise CLIError('usage error: {} TYPE KEY [ARGS]'.format(option_string))
+        models = _get_monitor_models()
+        return _parse_notification(values, option_string, models.RuleEmailAction, models.RuleWebhookAction)
 
 
 class AlertRemoveAction(argparse._AppendAction):
@@ -130,9 +146,8 @@ class AlertRemoveAction(argparse._AppendAction):
     def get_action(self, values, option_string):  # pylint: disable=no-self-use
         # TYPE is artificially enforced to create consistency with the --add-action argument
         # but it could be enhanced to do additional validation in the future.
-        from knack.util import CLIError
         _type = values[0].lower()
-        if _type not in ['email', 'webhook']:
+        if _type not in _NOTIFICATION_TYPES:
             raise CLIError('usage error: {} TYPE KEY [KEY ...]'.format(option_string))
         return values[1:]
 
@@ -144,21 +159,8 @@ class AutoscaleAddAction(argparse._AppendAction):
         super(AutoscaleAddAction, self).__call__(parser, namespace, action, option_string)
 
     def get_action(self, values, option_string):  # pylint: disable=no-self-use
-        from knack.util import CLIError
-        _type = values[0].lower()
-        if _type == 'email':
-            from azure.mgmt.monitor.models import EmailNotification
-            return EmailNotification(custom_emails=values[1:])
-        elif _type == 'webhook':
-            from azure.mgmt.monitor.models import WebhookNotification
-            uri = values[1]
-            try:
-                properties = dict(x.split('=', 1) for x in values[2:])
-            except ValueError:
-                raise CLIError('usage error: {} webhook URI [KEY=VALUE ...]'.format(option_string))
-            return WebhookNotification(uri, properties)
-
-        raise CLIError('usage error: {} TYPE KEY [ARGS]'.format(option_string))
+        models = _get_monitor_models()
+        return _parse_notification(values, option_string, models.EmailNotification, models.WebhookNotification)
 
 
 class AutoscaleRemoveAction(argparse._AppendAction):
@@ -169,20 +171,20 @@ class AutoscaleRemoveAction(argparse._AppendAction):
     def get_action(self, values, option_string):  # pylint: disable=no-self-use
         # TYPE is artificially enforced to create consistency with the --add-action argument
         # but it could be enhanced to do additional validation in the future.
-        from knack.util import CLIError
         _type = values[0].lower()
-        if _type not in ['email', 'webhook']:
+        if _type not in _NOTIFICATION_TYPES:
             raise CLIError('usage error: {} TYPE KEY [KEY ...]'.format(option_string))
         return values[1:]
 
 
 class AutoscaleConditionAction(argparse.Action):  # pylint: disable=protected-access
     def __call__(self, parser, namespace, values, option_string=None):
-        from azure.mgmt.monitor.models import MetricTrigger
+        models = _get_monitor_models()
         if len(values) == 1:
             # workaround because CMD.exe eats > character... Allows condition to be
-            # specified as a quoted expression
-            values = values[0].split(' ')
+            # specified as a quoted expression. Only the trailing four tokens are split off so a
+            # metric name containing spaces stays whole.
+            values = values[0].rsplit(' ', 4)
         name_offset = 0
         try:
             metric_name = ' '.join(values[name_offset:-4])
@@ -191,10 +193,9 @@ class AutoscaleConditionAction(argparse.Action):  # pylint: disable=protected-ac
             aggregation = get_autoscale_aggregation_map()[values[-2].lower()]
             window = period_type(values[-1])
         except (IndexError, KeyError):
-            from knack.util import CLIError
             raise CLIError('usage error: --condition METRIC {==,!=,>,>=,<,<=} '
                            'THRESHOLD {avg,min,max,total,count} PERIOD')
-        condition = MetricTrigger(
+        condition = models.MetricTrigger(
             metric_name=metric_name,
             metric_resource_uri=None,  # will be filled in later
             time_grain=None,  # will be filled in later
@@ -209,26 +210,25 @@ class AutoscaleConditionAction(argparse.Action):  # pylint: disable=protected-ac
 
 class AutoscaleScaleAction(argparse.Action):  # pylint: disable=protected-access
     def __call__(self, parser, namespace, values, option_string=None):
-        from azure.mgmt.monitor.models import ScaleAction, ScaleType
+        models = _get_monitor_models()
         if len(values) == 1:
             # workaround because CMD.exe eats > character... Allows condition to be
-            # specified as a quoted expression
-            values = values[0].split(' ')
+            # specified as a quoted expression. A third part is enough to reject extra tokens.
+            values = values[0].split(' ', 2)
         if len(values) != 2:
-            from knack.util import CLIError
             raise CLIError('usage error: --scale {in,out,to} VALUE[%]')
         dir_val = values[0]
         amt_val = values[1]
         scale_type = None
         if dir_val == 'to':
-            scale_type = ScaleType.exact_count.value
-        elif str(amt_val).endswith('%'):
-            scale_type = ScaleType.percent_change_count.value
+            scale_type = models.ScaleType.exact_count.value
+        elif amt_val.endswith('%'):
+            scale_type = models.ScaleType.percent_change_count.value
             amt_val = amt_val[:-1]  # strip off the percent
         else:
-            scale_type = ScaleType.change_count.value
+            scale_type = models.ScaleType.change_count.value
 
-        scale = ScaleAction(
+        scale = models.ScaleAction(
             direction=get_autoscale_scale_direction_map()[dir_val],
             type=scale_type,
             cooldown=None,  # this will be filled in later
@@ -262,6 +262,11 @@ class MultiObjectsDeserializeAction(argparse._AppendAction):  # pylint: disable=
 
 
 class ActionGroupReceiverParameterAction(MultiObjectsDeserializeAction):
+    _deserializers = None
+
     def get_deserializer(self, type_name):
-        from azure.mgmt.monitor.models import EmailReceiver, SmsReceiver, WebhookReceiver
-        return {'email': EmailReceiver, 'sms': SmsReceiver, 'webhook': WebhookReceiver}[type_name]
+        if ActionGroupReceiverParameterAction._deserializers is None:
+            models = _get_monitor_models()
+            ActionGroupReceiverParameterAction._deserializers = {
+                'email': models.EmailReceiver, 'sms': models.SmsReceiver, 'webhook': models.WebhookReceiver}
+        return ActionGroupReceiverParameterAction._deserializers[type_name]
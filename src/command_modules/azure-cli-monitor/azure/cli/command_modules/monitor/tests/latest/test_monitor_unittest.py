@@ -22,6 +22,24 @@ class FilterBuilderTests(unittest.TestCase):
         self.assertTrue(isinstance(template, dict))
 
 
+class MonitorArgumentTypeTests(unittest.TestCase):
+    def test_monitor_period_type(self):
+        from azure.cli.command_modules.monitor.actions import period_type
+
+        # shorthand is converted, with M read as minutes
+        self.assertEqual(period_type('5m'), 'PT5M')
+        self.assertEqual(period_type('1h30m'), 'PT1H30M')
+        self.assertEqual(period_type('1d2h3m4s'), 'P1DT2H3M4S')
+
+        # ISO8601 strings are returned unchanged
+        self.assertEqual(period_type('PT5M'), 'PT5M')
+        self.assertEqual(period_type('p1dt1h'), 'p1dt1h')
+
+        for value in ['x', '5x', '5', 'm5', '1h1d']:
+            with self.assertRaises(ValueError):
+                period_type(value)
+
+
 def _mock_get_subscription_id(_):
     return '00000000-0000-0000-0000-000000000000'
 
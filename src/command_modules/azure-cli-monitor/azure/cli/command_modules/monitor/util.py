@@ -3,11 +3,25 @@
 # Licensed under the MIT License. See License.txt in the project root for license information.
 # --------------------------------------------------------------------------------------------
 
+from functools import wraps
 
 # ISO format with explicit indication of timezone
 DATE_TIME_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
 
 
+def _cached_map(func):
+    """ Build the map returned by func once and hand back the same dict on later calls. The maps are
+    read-only lookup tables, so sharing a single instance across callers is safe. """
+    cache = []
+
+    @wraps(func)
+    def _wrapper():
+        if not cache:
+            cache.append(func())
+        return cache[0]
+    return _wrapper
+
+
 def get_resource_group_location(cli_ctx, name):
     from azure.cli.core.commands.client_factory import get_mgmt_service_client
     from azure.cli.core.profiles import ResourceType
@@ -16,12 +30,14 @@ def get_resource_group_location(cli_ctx, name):
     return get_mgmt_service_client(cli_ctx, ResourceType.MGMT_RESOURCE_RESOURCES).resource_groups.get(name).location
 
 
+@_cached_map
 def get_operator_map():
     from azure.mgmt.monitor.models import ConditionOperator
     return {'>': ConditionOperator.greater_than.value, '>=': ConditionOperator.greater_than_or_equal.value,
             '<': ConditionOperator.less_than, '<=': ConditionOperator.less_than_or_equal}
 
 
+@_cached_map
 def get_aggregation_map():
     from azure.mgmt.monitor.models import TimeAggregationOperator
     return {'avg': TimeAggregationOperator.average.value, 'min': TimeAggregationOperator.minimum.value,
@@ -30,12 +46,14 @@ def get_aggregation_map():
 
 
 # region Autoscale Maps
+@_cached_map
 def get_autoscale_statistic_map():
     from azure.mgmt.monitor.models import MetricStatisticType
     return {'avg': MetricStatisticType.average.value, 'min': MetricStatisticType.min.value,
             'max': MetricStatisticType.max.value, 'sum': MetricStatisticType.sum.value}
 
 
+@_cached_map
 def get_autoscale_operator_map():
     from azure.mgmt.monitor.models import ComparisonOperationType
     return {'==': ComparisonOperationType.equals.value, '!=': ComparisonOperationType.not_equals.value,
@@ -43,6 +61,7 @@ def get_autoscale_operator_map():
             '<': ComparisonOperationType.less_than, '<=': ComparisonOperationType.less_than_or_equal}
 
 
+@_cached_map
 def get_autoscale_aggregation_map():
     from azure.mgmt.monitor.models import TimeAggregationType
     return {'avg': TimeAggregationType.average.value, 'min': TimeAggregationType.minimum.value,
@@ -50,6 +69,7 @@ def get_autoscale_aggregation_map():
             'count': TimeAggregationType.count.value}
 
 
+@_cached_map
 def get_autoscale_scale_direction_map():
     from azure.mgmt.monitor.models import ScaleDirection
     return {'to': ScaleDirection.none.value, 'out': ScaleDirection.increase.value,
@@ -3,6 +3,7 @@
 # Licensed under the MIT License. See License.txt in the project root for license information.
 # --------------------------------------------------------------------------------------------
 
+import os
 from codecs import open
 from setuptools import setup
 try:
@@ -12,6 +13,18 @@ except ImportError:
     logger.warn("Wheel is not available, disabling bdist_wheel hook")
     cmdclass = {}
 
+# Optionally compile the argument parsing actions with Cython. The published wheel is universal, so this is
+# opt-in; actions.py remains the source and is used as-is whenever the compiled module is absent.
+EXT_MODULES = []
+if os.environ.get('AZURE_CLI_MONITOR_CYTHONIZE'):
+    try:
+        from Cython.Build import cythonize
+        EXT_MODULES = cythonize(['azure/cli/command_modules/monitor/actions.py'],
+                                compiler_directives={'language_level': 3})
+    except ImportError:
+        from distutils import log as logger
+        logger.warn("Cython is not available, actions.py will not be compiled")
+
 VERSION = "0.1.3"
 CLASSIFIERS = [
     'Development Status :: 4 - Beta',
@@ -57,5 +70,6 @@ setup(
     ],
     package_data={'azure.cli.command_modules.monitor.operations': ['autoscale-parameters-template.json']},
     install_requires=DEPENDENCIES,
+    ext_modules=EXT_MODULES,
     cmdclass=cmdclass
 )